@@ -1,18 +1,20 @@
 import html
-import json
 import re
 import csv
+import functools
 import os
 import click
-import time
-import random
+import orjson
 from argparse import ArgumentParser
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-from bs4 import BeautifulSoup, NavigableString
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
 from termcolor import cprint
 import requests
-from requests.exceptions import ConnectionError, Timeout, RequestException
+from requests.exceptions import RequestException
 
+from ucla_cli import cache
 from ucla_cli import query
 from ucla_cli import extract
 from ucla_cli.course_titles_view import course_titles_view
@@ -21,9 +23,52 @@ from ucla_cli.get_course_summary import get_course_summary as imported_get_cours
 from ucla_cli.results import results
 from ucla_cli.clean import clean_course_summary
 from ucla_cli import section_details
+from ucla_cli import debug as debug_output
+from ucla_cli.debug import debug
 
-def extract_location(soup):
-    location_columns = soup.find_all(class_="locationColumn")
+# Course listing pages only carry data in the section divs, the course title
+# headers nested in them, the AddToCourseData scripts and the pager, so skip
+# building tags for everything else.
+COURSE_LIST_STRAINER = SoupStrainer(["div", "script", "h3", "button", "p", "a", "ul", "li"])
+
+TITLE_ID_RE = re.compile(r"-title$")
+SEARCH_PANEL_RE = re.compile(r"SearchPanelSetup\('(\[.*\])'.*\)")
+ADD_COURSE_RE = re.compile("addCourse")
+# The model JSON can itself contain parentheses, so only the id is non-greedy.
+ADD_TO_COURSE_DATA_RE = re.compile(r"AddToCourseData\((.*?),(\{.*\})\)")
+# Independent study and thesis courses list many sections that share one
+# description. Matched anywhere in the number, like the substring check it
+# replaces (e.g. "M299" and "299A" count too).
+SPECIAL_COURSE_RE = re.compile(r"299|59[6-9]")
+
+# Course summaries and section detail pages are fetched concurrently, the
+# session's rate limiter keeps the overall request rate polite.
+SUMMARY_WORKERS = 8
+DETAIL_WORKERS = 8
+
+# Listing pages are requested this many at a time, so the next page is
+# already downloading while the current one is parsed and its summaries
+# fetched. The end of the list is only known after parsing, which costs at
+# most PAGE_PREFETCH - 1 wasted requests per subject.
+PAGE_PREFETCH = 2
+
+# The subject list changes at most once a quarter.
+TERM_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+SA_HOST = "https://sa.ucla.edu"
+
+CSV_BATCH_ROWS = 1000
+
+# Subject codes are ASCII, so mapping the Latin-1 range covers every
+# character that can turn up in a CSV file name.
+FILENAME_TABLE = {i: "_" for i in range(256) if not chr(i).isalnum()}
+
+SUMMARY_COLUMNS = (
+    "statusColumn", "waitlistColumn", "dayColumn", "timeColumn",
+    "locationColumn", "unitsColumn", "instructorColumn",
+)
+
+def location_from_columns(location_columns):
     if len(location_columns) > 1:
         p = location_columns[1].find("p")
         if p and p.button:
@@ -32,53 +77,21 @@ def extract_location(soup):
             return p.text.strip()
     return "N/A"
 
-def extract_course_summary(soup):
-    status_data = soup.find_all(class_="statusColumn")[1].find("p")
-    section_id = None
-    section_link = None
-    try:
-        section_divs = soup.find_all(class_="cls-section")
-        click.echo(click.style(f"Found {len(section_divs)} cls-section divs", fg='blue'))
-        for i, div in enumerate(section_divs):
-            if i == 0:
-                click.echo(click.style(f"First cls-section div HTML sample: {div.prettify()[:200]}...", fg='blue'))
-            p_tag = div.find('p', class_="hide-small")
-            if p_tag:
-                link_tag = p_tag.find('a')
-                if link_tag and 'href' in link_tag.attrs:
-                    href = link_tag['href']
-                    section_id = link_tag.text.strip()
-                    if href.startswith('/'):
-                        href = "https://sa.ucla.edu" + href
-                    section_link = href
-                    click.echo(click.style(f"Found section link: {section_id} -> {section_link}", fg='green'))
-                    break
-    except Exception as e:
-        click.echo(click.style(f"Error extracting section link: {str(e)}", fg='red'))
-    result = {
-        "status": [x for x in status_data.contents if isinstance(x, NavigableString)],
-        "waitlist": soup.find_all(class_="waitlistColumn")[1].find("p").contents[0],
-        "day": soup.find_all(class_="dayColumn")[1].find("p").text,
-        "time": [x for x in soup.find_all(class_="timeColumn")[1].find_all("p")[1].contents if isinstance(x, NavigableString)],
-        "location": extract_location(soup),
-        "units": soup.find_all(class_="unitsColumn")[1].find("p").contents[0],
-        "instructor": soup.find_all(class_="instructorColumn")[1].find("p").contents[0],
-        "section_id": section_id,
-        "section_link": section_link
-    }
-    click.echo(click.style(f"Extracted section_id: {result['section_id']}", fg='cyan'))
-    click.echo(click.style(f"Extracted section_link: {result['section_link']}", fg='cyan'))
-    return result
+def bucket_columns(soup):
+    """Group the summary column tags under soup by column class in one walk."""
+    columns = {c: [] for c in SUMMARY_COLUMNS}
+    for tag in soup.find_all(class_=list(SUMMARY_COLUMNS)):
+        for c in tag.get("class", []):
+            if c in columns:
+                columns[c].append(tag)
+    return columns
 
 def extract_section_links(soup):
     section_links = {}
-    section_divs = soup.find_all(class_="cls-section")
-    click.echo(click.style(f"Found {len(section_divs)} cls-section divs for link extraction", fg='blue'))
+    section_divs = soup.find_all(class_="cls-section", id=True)
+    debug(f"Found {len(section_divs)} cls-section divs for link extraction", fg='blue')
     for div in section_divs:
-        div_id = div.get('id', '')
-        if not div_id:
-            continue
-        parts = div_id.split('_')
+        parts = div['id'].split('_')
         if len(parts) < 2:
             continue
         class_id = parts[0]
@@ -91,110 +104,99 @@ def extract_section_links(soup):
         href = link_tag['href']
         section_id_text = link_tag.text.strip()
         if href.startswith('/'):
-            href = "https://sa.ucla.edu" + href
+            href = SA_HOST + href
         section_links[class_id] = {
             'section_id': section_id_text,
             'section_link': href
         }
-        click.echo(click.style(f"Mapped class ID {class_id} to section {section_id_text}", fg='green'))
+        debug(f"Mapped class ID {class_id} to section {section_id_text}", fg='green')
     return section_links
 
 def extract_course_data(soup):
-    scripts = soup.find_all(string=re.compile("addCourse"))
+    scripts = soup.find_all("script", string=ADD_COURSE_RE)
     models = []
     for script in scripts:
-        m = re.search(r"AddToCourseData\((.*),({.*})\)", script.string)
+        m = ADD_TO_COURSE_DATA_RE.search(script.string)
         if m:
             course_id_json = m.group(1)
             model_json = m.group(2)
             try:
-                course_id = json.loads(course_id_json)
-                model = json.loads(model_json)
+                course_id = orjson.loads(course_id_json)
+                model = orjson.loads(model_json)
                 models.append((course_id, model))
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 click.echo(click.style(f"Error decoding JSON in extract_course_data: {e}", fg='red'))
                 click.echo(click.style(f"Problematic course_id_json: {course_id_json}", fg='red'))
                 click.echo(click.style(f"Problematic model_json: {model_json}", fg='red'))
     return models
 
-def save_to_csv(term, subject, subject_name, courses, csv_filename=None):
-    if not csv_filename:
-        subject_clean = "".join(c if c.isalnum() else "_" for c in subject.strip())
-        csv_filename = f"{term}/{subject_clean}.csv"
-    if not courses:
-        click.echo(f"No courses to export to CSV file.")
-        return
-    if courses and len(courses) > 0:
-        click.echo(click.style("First course data being exported:", fg='blue'))
-        first_course = courses[0]
-        click.echo(click.style(f"Number: {first_course.get('number', 'N/A')}", fg='blue'))
-        click.echo(click.style(f"Name: {first_course.get('name', 'N/A')}", fg='blue'))
-    headers = ["Subject", "Subject Name", "Number", "Name", "Section ID", "Section Link",
+CSV_HEADERS = ["Subject", "Subject Name", "Number", "Name", "Section ID", "Section Link",
            "Status", "Waitlist", "Day", "Time", "Location", "Units", "Instructor",
            "Course Description", "Class Description Detail", "General Education GE", 
            "Writing II Requirement", "Diversity Info", "Class Notes"]
-    courses_with_links = sum(1 for course in courses if course.get("data", {}).get("section_link"))
-    click.echo(click.style(f"Found {courses_with_links} out of {len(courses)} courses with section links for CSV", fg='green'))
-    try:
-        with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(headers)
-            for i, course in enumerate(courses):
-                data = course.get("data", {})
-                section_id = data.get("section_id", "")
-                section_link = data.get("section_link", "")
-                row = [
-                    subject.strip(),
-                    subject_name.strip(),
-                    course.get("number", "").strip(),
-                    course.get("name", "").strip(),
-                    section_id,
-                    section_link,
-                    " ".join(str(x).strip() for x in data.get("status", [])),
-                    data.get("waitlist", ""),
-                    data.get("day", ""),
-                    " ".join(str(x).strip() for x in data.get("time", [])),
-                    data.get("location", ""),
-                    data.get("units", ""),
-                    data.get("instructor", ""),
-                    data.get("course_description", ""),
-                    data.get("class_description_detail", ""),
-                    data.get("general_education_ge", ""),
-                    data.get("writing_ii_requirement", ""),
-                    data.get("diversity_info", ""),
-                    data.get("class_notes", "")
-                ]
-                writer.writerow(row)
-        click.echo(f"Courses exported to CSV file: {csv_filename}")
-        with open(csv_filename, 'r', encoding='utf-8') as csvfile:
-            reader = csv.reader(csvfile)
-            _ = next(reader)
-            rows_read = list(reader)
-            links_in_csv = sum(1 for row_data in rows_read if len(row_data) > 5 and row_data[5])
-            click.echo(click.style(f"CSV validation: Found {links_in_csv} rows with section links in '{csv_filename}'", fg='green'))
-    except Exception as e:
-        click.echo(f"Error writing to CSV file: {e}")
+# The section data key written under each of CSV_HEADERS.
+CSV_FIELDS = ["subject", "subject_name", "number", "name", "section_id", "section_link",
+           "status", "waitlist", "day", "time", "location", "units", "instructor",
+           "course_description", "class_description_detail", "general_education_ge",
+           "writing_ii_requirement", "diversity_info", "class_notes"]
+
+def csv_filename_for(term, subject):
+    subject_clean = subject.strip().translate(FILENAME_TABLE)
+    return f"{term}/{subject_clean}.csv"
+
+def open_csv_writer(path):
+    """Open path for streaming CSV export and write the header row."""
+    csv_file = open(path, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+    writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDS, restval="", extrasaction="ignore")
+    writer.writerow(dict(zip(CSV_FIELDS, CSV_HEADERS)))
+    return csv_file, writer
+
+def csv_row_emitter(writer, subject, subject_name):
+    """Return (emit, flush) for this subject's rows.
+
+    emit(number, name, data) queues one row; rows are handed to the writer
+    CSV_BATCH_ROWS at a time, and flush() writes whatever is still queued.
+    """
+    subject = subject.strip()
+    subject_name = subject_name.strip()
+    batch = []
+    append = batch.append
+
+    def flush():
+        writer.writerows(batch)
+        batch.clear()
+
+    def emit(number, name, data):
+        append(dict(data, subject=subject, subject_name=subject_name, number=number, name=name))
+        if len(batch) >= CSV_BATCH_ROWS:
+            flush()
+    return emit, flush
+
+def direct_strings(tag):
+    """Return the text nodes directly under tag, skipping nested tags' text.
+
+    Status and time lines are separated by <br>; screen-reader spans and
+    icons nested in the same <p> must not shift their positions.
+    """
+    return [x for x in tag.contents if isinstance(x, NavigableString)]
 
 def extract_all_section_data(soup):
     sections = []
-    section_rows = soup.find_all("div", class_=lambda x: x and "data_row" in x and "primary-row" in x)
-    click.echo(click.style(f"Found {len(section_rows)} section rows in course summary (extract_all_section_data)", fg='blue'))
+    section_rows = soup.select("div.data_row.primary-row")
+    debug(f"Found {len(section_rows)} section rows in course summary (extract_all_section_data)", fg='blue')
     for row_idx, row in enumerate(section_rows):
         try:
             row_id = row.get('id', '')
             class_id = row_id.split('_')[0] if '_' in row_id else None
-            status_col = row.find(class_="statusColumn")
-            waitlist_col = row.find(class_="waitlistColumn")
-            day_col = row.find(class_="dayColumn")
-            time_col = row.find(class_="timeColumn")
-            location_col = row.find(class_="locationColumn")
-            units_col = row.find(class_="unitsColumn")
-            instructor_col = row.find(class_="instructorColumn")
+            columns = bucket_columns(row)
+            status_col, waitlist_col, day_col, time_col, location_col, units_col, instructor_col = (
+                columns[c][0] if columns[c] else None for c in SUMMARY_COLUMNS
+            )
             section_id_text = None
             section_link_href = None
-            first_col_content = row.find(class_=lambda x: x and ("sectionColumn" in x or "col-1" in x))
+            first_col_content = row.select_one('[class*="sectionColumn"], [class*="col-1"]')
             if not first_col_content:
-                 cols = row.find_all(lambda tag: tag.name == 'div' and 'Column' in ''.join(tag.get('class', [])))
+                 cols = row.select('div[class*="Column"]')
                  if cols:
                     first_col_content = cols[0]
             if first_col_content:
@@ -203,28 +205,33 @@ def extract_all_section_data(soup):
                     href_val = link_tag['href']
                     section_id_text = link_tag.text.strip()
                     if href_val.startswith('/'):
-                        href_val = "https://sa.ucla.edu" + href_val
+                        href_val = SA_HOST + href_val
                     section_link_href = href_val
             time_p_tags = time_col.find_all("p") if time_col else []
             time_data = []
             if len(time_p_tags) > 1:
-                 time_data = [x for x in time_p_tags[1].contents if isinstance(x, NavigableString)]
+                 time_data = direct_strings(time_p_tags[1])
             elif time_p_tags:
-                 time_data = [x for x in time_p_tags[0].contents if isinstance(x, NavigableString)]
+                 time_data = direct_strings(time_p_tags[0])
+            status_p = status_col.find("p") if status_col else None
+            waitlist_p = waitlist_col.find("p") if waitlist_col else None
+            day_p = day_col.find("p") if day_col else None
+            units_p = units_col.find("p") if units_col else None
+            instructor_p = instructor_col.find("p") if instructor_col else None
             section_data = {
                 "class_id": class_id,
-                "status": [x for x in status_col.find("p").contents if isinstance(x, NavigableString)] if status_col and status_col.find("p") else ["N/A"],
-                "waitlist": waitlist_col.find("p").contents[0].strip() if waitlist_col and waitlist_col.find("p") and waitlist_col.find("p").contents else "N/A",
-                "day": day_col.find("p").text.strip() if day_col and day_col.find("p") else "N/A",
+                "status": direct_strings(status_p) if status_p else ["N/A"],
+                "waitlist": waitlist_p.contents[0].strip() if waitlist_p and waitlist_p.contents else "N/A",
+                "day": day_p.text.strip() if day_p else "N/A",
                 "time": time_data,
-                "location": extract_location(row) if location_col else "N/A",
-                "units": units_col.find("p").contents[0].strip() if units_col and units_col.find("p") and units_col.find("p").contents else "N/A",
-                "instructor": instructor_col.find("p").contents[0].strip() if instructor_col and instructor_col.find("p") and instructor_col.find("p").contents else "N/A",
+                "location": location_from_columns(columns["locationColumn"]) if location_col else "N/A",
+                "units": units_p.contents[0].strip() if units_p and units_p.contents else "N/A",
+                "instructor": instructor_p.contents[0].strip() if instructor_p and instructor_p.contents else "N/A",
                 "section_id": section_id_text,
                 "section_link": section_link_href
             }
             sections.append(section_data)
-            click.echo(click.style(f"Extracted section data: {section_id_text} (Class ID: {class_id})", fg='green'))
+            debug(f"Extracted section data: {section_id_text} (Class ID: {class_id})", fg='green')
         except Exception as e:
             click.echo(click.style(f"Error extracting one section's data (row {row_idx}): {str(e)}", fg='red'))
             sections.append({
@@ -234,6 +241,23 @@ def extract_all_section_data(soup):
             })
     return sections
 
+def prefetch_pages(term, subject_code, subject_name, depth=PAGE_PREFETCH):
+    """Yield (page number, listing html) in order, fetching ahead of the caller."""
+    pool = ThreadPoolExecutor(max_workers=depth)
+    pending = deque()
+    page = 1
+    try:
+        while True:
+            while len(pending) < depth:
+                pending.append((page, pool.submit(course_titles_view, term, subject_code, subject_name, page)))
+                page += 1
+            number, future = pending.popleft()
+            yield number, future.result()
+    finally:
+        for _, future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
+
 def get_course_summary_for_all_sections(model):
     sum_soup = imported_get_course_summary(model)
     if not sum_soup:
@@ -242,6 +266,16 @@ def get_course_summary_for_all_sections(model):
     sections = extract_all_section_data(sum_soup)
     return sections
 
+# Values extract_section_details_from_url uses for missing details, which
+# are not worth a line in the listing.
+PLACEHOLDER_VALUES = frozenset({
+    "N/A", "N/A (No URL provided)", "N/A (Failed to fetch page content)", "N/A (Empty)",
+})
+
+def is_placeholder(value):
+    # Status and time can still be lists, which can't be hashed.
+    return not value or (isinstance(value, str) and value in PLACEHOLDER_VALUES)
+
 def display_course(subject, subject_name, number, name, data, orig_data, course_details, section_label=None):
     course_title_str = f"{subject_name} ({subject}) {number} - {name}"
     if section_label:
@@ -265,7 +299,7 @@ def display_course(subject, subject_name, number, name, data, orig_data, course_
 
     for key in display_order:
         value = data.get(key)
-        if value and value != "N/A" and value != "N/A (No URL provided)" and value != "N/A (Failed to fetch page content)" and value != "N/A (Empty)":
+        if not is_placeholder(value):
             if key in ["section_id", "section_link"]:
                 click.secho(f"  {key.replace('_', ' ').title()}: ", fg="yellow", nl=False)
             else:
@@ -279,249 +313,264 @@ def display_course(subject, subject_name, number, name, data, orig_data, course_
 
     # Display any other keys not in display_order (if any)
     for key, value in data.items():
-        if key not in displayed_keys and value and value != "N/A" and value != "N/A (No URL provided)" and value != "N/A (Failed to fetch page content)" and value != "N/A (Empty)":
+        if key not in displayed_keys and not is_placeholder(value):
             click.secho(f"  {key.replace('_', ' ').title()}: ", fg="blue", nl=False)
             if isinstance(value, list):
                 click.secho(" ".join(map(str, value)).strip(), fg="white")
             else:
                 click.secho(str(value).strip(), fg="white")
 
+## courses not included in summer 25
+SUBJECT_OVERRIDES = {
+    "afrcst": ("African Studies", "AFRC ST"),
+    # "anes": ("Anesthesiology", "ANES"),
+    "appling": ("Applied Linguistics", "APPLING"),
+    "art&arc": ("Arts and Architecture", "ART&ARC"),
+    "eastds": ("East Asian Studies", "EA STDS"),
+    "fiatlx": ("Fiat Lux", "FIAT LX"),
+    "jewish": ("Jewish Studies", "JEWISH"),
+    "law": ("Law", "LAW"),
+    "ug-law": ("Law (Undergraduate)", "UG-LAW"),
+    "med": ("Medicine", "MED"),
+    "medhis": ("Medical History", "MED HIS"),
+    "neursgy": ("Medicine", "NEURSGY"),
+    "physiol": ("Physiology", "PHYSIOL"),
+    "soctht": ("Social Thought", "SOC THT"),
+}
+
+def reduce_subject(x):
+    return x.replace(" ", "").lower()
+
+@functools.lru_cache(maxsize=None)
+def subject_map_for(term):
+    """Map reduced subject codes to (name, code) for term, built once per process."""
+    subject_table = cache.load_json(f"subjects_{term}.json", TERM_CACHE_MAX_AGE)
+    if subject_table is None:
+        text = results()
+        subject_table_search = SEARCH_PANEL_RE.search(text)
+        # if not subject_table_search:
+        #     click.echo(click.style("Could not find subject table in initial results.", fg='red'))
+        #     return
+        subject_table_json = html.unescape(subject_table_search.group(1))
+        subject_table = orjson.loads(subject_table_json)
+        cache.save_json(f"subjects_{term}.json", subject_table)
+    return {reduce_subject(x["value"]): (x["label"], x["value"]) for x in subject_table}
+
 def soc(term, subject, course_details, mode, csv_export=False, quiet_csv=False):
-    text = results()
-    def reduce_subject(x):
-        return x.replace(" ", "").lower()
-    subject_table_search = re.search(r"SearchPanelSetup\('(\[.*\])'.*\)", text)
-    # if not subject_table_search:
-    #     click.echo(click.style("Could not find subject table in initial results.", fg='red'))
-    #     return
-    subject_table_json = html.unescape(subject_table_search.group(1))
-    subject_table = json.loads(subject_table_json)
-    subject_name_table = {reduce_subject(x["value"]): x["label"] for x in subject_table}
-    subject_code_table = {reduce_subject(x["value"]): x["value"] for x in subject_table}
+    subject_map = subject_map_for(term)
     reduced_subj = reduce_subject(subject)
 
-    # click.echo(f"Subject table: {subject_name_table}")
-
-    ## courses not included in summer 25
-    if reduced_subj == "afrcst":
-        subject_name = "African Studies"
-        subject_code = "AFRC ST"
-    # elif reduced_subj == "anes":
-    #     subject_name = "Anesthesiology"
-    #     subject_code = "ANES"
-    elif reduced_subj == "appling":
-        subject_name = "Applied Linguistics"
-        subject_code = "APPLING"
-    elif reduced_subj == "art&arc":
-        subject_name = "Arts and Architecture"
-        subject_code = "ART&ARC"
-    elif reduced_subj == "eastds":
-        subject_name = "East Asian Studies"
-        subject_code = "EA STDS"
-    elif reduced_subj == "fiatlx":
-        subject_name = "Fiat Lux"
-        subject_code = "FIAT LX"
-    elif reduced_subj == "jewish":
-        subject_name = "Jewish Studies"
-        subject_code = "JEWISH"
-    elif reduced_subj == "law":
-        subject_name = "Law"
-        subject_code = "LAW"
-    elif reduced_subj == "ug-law":
-        subject_name = "Law (Undergraduate)"
-        subject_code = "UG-LAW"
-    elif reduced_subj == "med":
-        subject_name = "Medicine"
-        subject_code = "MED"
-    elif reduced_subj == "medhis":
-        subject_name = "Medical History"
-        subject_code = "MED HIS"
-    elif reduced_subj == "neursgy":
-        subject_name = "Medicine"
-        subject_code = "NEURSGY"
-    elif reduced_subj == "physiol":
-        subject_name = "Physiology"
-        subject_code = "PHYSIOL"
-    elif reduced_subj == "soctht":
-        subject_name = "Social Thought"
-        subject_code = "SOC THT"
-    elif reduced_subj not in subject_name_table:
+    # click.echo(f"Subject table: {subject_map}")
+
+    override = SUBJECT_OVERRIDES.get(reduced_subj)
+    if override:
+        subject_name, subject_code = override
+    elif reduced_subj not in subject_map:
         click.echo(click.style(f"Subject '{subject}' not found. Please use a valid subject area.", fg='red'))
         return
     else:
-        subject_name = subject_name_table[reduced_subj]
-        subject_code = subject_code_table[reduced_subj]
+        subject_name, subject_code = subject_map[reduced_subj]
     text = results(term, subject_code)
-    soup = BeautifulSoup(text, 'html.parser')
+    soup = BeautifulSoup(text, 'lxml')
     locations_options = soup.select("#Location_options option")
     locations = {l.contents[0]: l['value'] for l in locations_options if l.contents}
     filters = {'location': locations}
-    page = 1
-    last_page = False
-    all_courses_for_csv = []
     section_link_missing_count = 0
+
+    # Rows are streamed to a temporary file that only replaces the CSV once
+    # the whole subject has been scraped, so a failed run never leaves a
+    # partial CSV behind for bulk.sh to skip.
+    csv_file = emit_row = flush_rows = None
+    csv_rows = csv_rows_with_links = 0
+    if csv_export:
+        csv_filename = csv_filename_for(term, subject_code)
+        try:
+            csv_file, csv_writer = open_csv_writer(csv_filename + ".tmp")
+        except OSError as e:
+            click.echo(f"Error writing to CSV file: {e}")
+        else:
+            emit_row, flush_rows = csv_row_emitter(csv_writer, subject_code, subject_name)
     
     # Dictionary to store course descriptions for special course numbers
     special_course_details = {}
     
-    while not last_page:
-        click.echo(f"Fetching page {page} for {subject_name}...")
-        text_page = course_titles_view(term, subject_code, subject_name, page)
-        if not text_page:
-             click.echo(f"No more content found on page {page}. Assuming end of results.")
-             break
-        page += 1
-        soup_page = BeautifulSoup(text_page, "html.parser")
-        section_links_map = extract_section_links(soup_page)
-        models = extract_course_data(soup_page)
-        if not models:
-            click.echo("No course models found on this page. Ending search.")
-            break
-        
-        for course_id_str, model_data in models:
-            title_element = soup_page.find(id=course_id_str + "-title")
-            if not title_element or not title_element.contents:
-                click.echo(click.style(f"Could not find title for course ID {course_id_str}", fg='yellow'))
-                continue
-            title_full = title_element.contents[0].strip()
-            try:
-                course_number, course_name_part = title_full.split(" - ", 1)
-            except ValueError:
-                click.echo(click.style(f"Could not parse title: {title_full}", fg='yellow'))
-                course_number = title_full
-                course_name_part = "N/A"
-            course_number = course_number.strip()
-            course_name_part = course_name_part.strip()
+    pages = prefetch_pages(term, subject_code, subject_name)
+    finished = False
+    try:
+        for page, text_page in pages:
+            click.echo(f"Fetching page {page} for {subject_name}...")
+            if not text_page:
+                 click.echo(f"No more content found on page {page}. Assuming end of results.")
+                 break
+            soup_page = BeautifulSoup(text_page, "lxml", parse_only=COURSE_LIST_STRAINER)
+            section_links_map = extract_section_links(soup_page)
+            models = extract_course_data(soup_page)
+            if not models:
+                click.echo("No course models found on this page. Ending search.")
+                break
+            titles = {tag['id']: tag for tag in soup_page.find_all(id=TITLE_ID_RE)}
+
+            course_summaries = {}
+            if course_details:
+                with ThreadPoolExecutor(max_workers=SUMMARY_WORKERS) as pool:
+                    course_summaries = {
+                        course_id_str: pool.submit(get_course_summary_for_all_sections, model_data)
+                        for course_id_str, model_data in models
+                    }
+
+            # Resolve every course's sections and links first, so the detail
+            # pages for the whole listing page are fetched concurrently.
+            # section_details memoizes them by URL, so a link seen on an
+            # earlier page is not fetched again.
+            courses = []
+            wanted_urls = {}
+            def want_details(url):
+                wanted_urls[url] = None
+            for course_id_str, model_data in models:
+                title_element = titles.get(course_id_str + "-title")
+                if not title_element or not title_element.contents:
+                    click.echo(click.style(f"Could not find title for course ID {course_id_str}", fg='yellow'))
+                    continue
+                title_full = title_element.contents[0].strip()
+                try:
+                    course_number, course_name_part = title_full.split(" - ", 1)
+                except ValueError:
+                    click.echo(click.style(f"Could not parse title: {title_full}", fg='yellow'))
+                    course_number = title_full
+                    course_name_part = "N/A"
+                course_number = course_number.strip()
+                course_name_part = course_name_part.strip()
             
-            # Check if this is a special course number (299, 596, 597, 598, 599)
-            is_special_course = any(special_num in course_number for special_num in ['299', '596', '597', '598', '599'])
+                # Check if this is a special course number (299, 596, 597, 598, 599)
+                is_special_course = bool(SPECIAL_COURSE_RE.search(course_number))
             
-            if course_details:
-                max_retries = 3
-                retry_count = 0
-                course_sections = []
-                
-                while retry_count < max_retries:
+                if course_details:
                     try:
-                        time.sleep(random.uniform(0.5, 2.0))
-                        course_sections = get_course_summary_for_all_sections(model_data)
-                        break
-                    except (ConnectionError, Timeout, RequestException) as e:
-                        retry_count += 1
-                        delay = retry_count * 2
-                        click.echo(click.style(f"Connection error for {subject_code} {course_number}. Retry {retry_count}/{max_retries} in {delay}s: {str(e)}", fg='red'))
-                        time.sleep(delay)
-                        if retry_count >= max_retries:
-                            click.echo(click.style(f"Failed to get course summary for {subject_code} {course_number} after {max_retries} retries.", fg='red'))
-                            course_sections = [{
-                                "status": ["Unknown - Connection Error"], "waitlist": "Unknown", "day": "Unknown",
-                                "time": ["Unknown"], "location": "Unknown", "units": "Unknown",
-                                "instructor": "Unknown", "section_id": None, "section_link": None, "class_id": model_data.get('classId')
-                            }]
+                        course_sections = course_summaries[course_id_str].result()
+                    except RequestException as e:
+                        click.echo(click.style(f"Failed to get course summary for {subject_code} {course_number}: {str(e)}", fg='red'))
+                        course_sections = [{
+                            "status": ["Unknown - Connection Error"], "waitlist": "Unknown", "day": "Unknown",
+                            "time": ["Unknown"], "location": "Unknown", "units": "Unknown",
+                            "instructor": "Unknown", "section_id": None, "section_link": None, "class_id": model_data.get('classId')
+                        }]
                 
-                if not course_sections:
-                    course_sections = [{
-                        "status": ["Unknown - Data Not Found"], "waitlist": "N/A", "day": "N/A",
-                        "time": ["N/A"], "location": "N/A", "units": "N/A",
-                        "instructor": "N/A", "section_id": None, "section_link": None, "class_id": model_data.get('classId')
-                    }]
-                
-                # For special course numbers, we'll only fetch detailed info for the first section
-                shared_details = {}
-                
-                for i, section_data_item in enumerate(course_sections): 
-                    class_id_from_section = section_data_item.get('class_id')
-                    if class_id_from_section and class_id_from_section in section_links_map:
-                        if not section_data_item.get('section_id'):
-                            section_data_item['section_id'] = section_links_map[class_id_from_section]['section_id']
-                        if not section_data_item.get('section_link'):
-                             section_data_item['section_link'] = section_links_map[class_id_from_section]['section_link']
-                             click.echo(click.style(f"Used fallback section link for {subject_code} {course_number} section {section_data_item.get('section_id', 'Unknown')}", fg='magenta'))
-                    
-                    details_from_link = {}
-                    
-                    should_fetch_details = True
-                    
-                    if is_special_course:
-                        if i == 0:
-                            click.echo(click.style(f"Special course detected: {course_number}. Will fetch details only for first section.", fg='cyan'))
-                        else:
-                            should_fetch_details = False
-                            click.echo(click.style(f"Using cached details for {course_number} section {section_data_item.get('section_id', f'#{i+1}')}", fg='cyan'))
+                    if not course_sections:
+                        course_sections = [{
+                            "status": ["Unknown - Data Not Found"], "waitlist": "N/A", "day": "N/A",
+                            "time": ["N/A"], "location": "N/A", "units": "N/A",
+                            "instructor": "N/A", "section_id": None, "section_link": None, "class_id": model_data.get('classId')
+                        }]
+
+                    details_urls = []
+                    for i, section_data_item in enumerate(course_sections):
+                        class_id_from_section = section_data_item.get('class_id')
+                        if class_id_from_section and class_id_from_section in section_links_map:
+                            if not section_data_item.get('section_id'):
+                                section_data_item['section_id'] = section_links_map[class_id_from_section]['section_id']
+                            if not section_data_item.get('section_link'):
+                                 section_data_item['section_link'] = section_links_map[class_id_from_section]['section_link']
+                                 debug(f"Used fallback section link for {subject_code} {course_number} section {section_data_item.get('section_id', 'Unknown')}", fg='magenta')
+                        # Sections of special courses share the first section's
+                        # description, so only that page is fetched for all of them.
+                        if i == 0 or not is_special_course:
+                            details_url = section_data_item.get("section_link")
+                        if not section_data_item.get("section_link"):
+                            details_urls.append(None)
+                            continue
+                        details_urls.append(details_url)
+                        if details_url:
+                            want_details(details_url)
+                    courses.append((course_number, course_name_part, is_special_course, course_sections, details_urls))
+                else:
+                    data_for_summary = {}
+                    class_id_from_model = model_data.get('classId')
+                    if class_id_from_model and class_id_from_model in section_links_map:
+                        data_for_summary['section_id'] = section_links_map[class_id_from_model]['section_id']
+                        data_for_summary['section_link'] = section_links_map[class_id_from_model]['section_link']
+                        if csv_export:
+                            want_details(data_for_summary['section_link'])
+                    courses.append((course_number, course_name_part, is_special_course, data_for_summary, None))
+
+            page_details = section_details.fetch_many(list(wanted_urls), workers=DETAIL_WORKERS)
+
+            for course_number, course_name_part, is_special_course, course_sections, details_urls in courses:
+                if course_details:
+                    for i, section_data_item in enumerate(course_sections): 
+                        if is_special_course:
+                            if i == 0:
+                                debug(f"Special course detected: {course_number}. Will fetch details only for first section.", fg='cyan')
+                            else:
+                                debug(f"Using cached details for {course_number} section {section_data_item.get('section_id', f'#{i+1}')}", fg='cyan')
                     
-                    if not section_data_item.get("section_link"):
-                        section_link_missing_count += 1
-                        click.echo(click.style(f"Section link missing for: {subject_code} {course_number} - {course_name_part}, Section: {section_data_item.get('section_id', f'#{i+1}')}", fg='yellow'))
-                    elif should_fetch_details:
-                        details_from_link = section_details.extract_section_details_from_url(section_data_item["section_link"])
-                        
-                        if is_special_course and i == 0:
-                            shared_details = {
-                                "course_description": details_from_link.get("course_description"),
-                                "class_description_detail": details_from_link.get("class_description_detail"),
-                                "general_education_ge": details_from_link.get("general_education_ge"),
-                                "writing_ii_requirement": details_from_link.get("writing_ii_requirement"),
-                                "diversity_info": details_from_link.get("diversity_info"),
-                                "class_notes": details_from_link.get("class_notes")
-                            }
-                    elif is_special_course and i > 0:
-                        details_from_link = shared_details
+                        if not section_data_item.get("section_link"):
+                            section_link_missing_count += 1
+                            debug(f"Section link missing for: {subject_code} {course_number} - {course_name_part}, Section: {section_data_item.get('section_id', f'#{i+1}')}", fg='yellow')
+                        details_url = details_urls[i]
+                        details_from_link = page_details[details_url] if details_url else {}
                     
-                    section_data_item.update(details_from_link)
+                        section_data_item.update(details_from_link)
                     
-                    orig_section_data = section_data_item.copy()
-                    cleaned_section_data = clean_course_summary(section_data_item, filters, mode)
+                        cleaned_section_data = clean_course_summary(section_data_item, filters, mode)
                     
-                    preserved_keys = [
-                        "section_id", "section_link", "course_description", "class_description_detail", 
-                        "general_education_ge", "writing_ii_requirement", "diversity_info", "class_notes"
-                    ]
-                    for key in preserved_keys:
-                        if orig_section_data.get(key):
-                            cleaned_section_data[key] = orig_section_data[key]
-                        elif not cleaned_section_data.get(key) and details_from_link.get(key): # If clean_course_summary removed it, but details_from_link had it
-                            cleaned_section_data[key] = details_from_link[key]
-
-                    if csv_export:
-                        all_courses_for_csv.append({
-                            "number": course_number,
-                            "name": course_name_part,
-                            "data": cleaned_section_data
-                        })
+                        preserved_keys = [
+                            "section_id", "section_link", "course_description", "class_description_detail", 
+                            "general_education_ge", "writing_ii_requirement", "diversity_info", "class_notes"
+                        ]
+                        for key in preserved_keys:
+                            if section_data_item.get(key):
+                                cleaned_section_data[key] = section_data_item[key]
+                            elif not cleaned_section_data.get(key) and details_from_link.get(key): # If clean_course_summary removed it, but details_from_link had it
+                                cleaned_section_data[key] = details_from_link[key]
+
+                        if emit_row:
+                            emit_row(course_number, course_name_part, cleaned_section_data)
+                            csv_rows += 1
+                            csv_rows_with_links += bool(cleaned_section_data.get("section_link"))
+                        if not (csv_export and quiet_csv):
+                            section_display_label = f"Section {cleaned_section_data.get('section_id', str(i+1))}" if len(course_sections) > 1 else None
+                            display_course(subject_code, subject_name, course_number, course_name_part,
+                                           cleaned_section_data, section_data_item, course_details, section_display_label)
+                else: 
+                    data_for_summary = course_sections
+                    orig_data_for_summary = {} 
+                    if csv_export and data_for_summary.get('section_link'):
+                        data_for_summary.update(page_details[data_for_summary['section_link']])
+
+                    if emit_row:
+                        emit_row(course_number, course_name_part, data_for_summary)
+                        csv_rows += 1
+                        csv_rows_with_links += bool(data_for_summary.get("section_link"))
                     if not (csv_export and quiet_csv):
-                        section_display_label = f"Section {cleaned_section_data.get('section_id', str(i+1))}" if len(course_sections) > 1 else None
                         display_course(subject_code, subject_name, course_number, course_name_part,
-                                       cleaned_section_data, orig_section_data, course_details, section_display_label)
-            else: 
-                data_for_summary = {}
-                orig_data_for_summary = {} 
-                class_id_from_model = model_data.get('classId')
-                current_section_link = None
-                if class_id_from_model and class_id_from_model in section_links_map:
-                    data_for_summary['section_id'] = section_links_map[class_id_from_model]['section_id']
-                    current_section_link = section_links_map[class_id_from_model]['section_link']
-                    data_for_summary['section_link'] = current_section_link
-                
-                if csv_export and current_section_link:
-                    details_from_link = section_details.extract_section_details_from_url(current_section_link)
-                    data_for_summary.update(details_from_link)
-
-                if csv_export:
-                    all_courses_for_csv.append({
-                        "number": course_number,
-                        "name": course_name_part,
-                        "data": data_for_summary 
-                    })
-                if not (csv_export and quiet_csv):
-                    display_course(subject_code, subject_name, course_number, course_name_part,
-                                   data_for_summary, orig_data_for_summary, course_details, section_label=None)
-        if soup_page.find(class_="lastPage"):
-            last_page = True
-            click.echo("Detected last page.")
-    if section_link_missing_count > 0:
-        click.echo(click.style(f"Total sections with missing links: {section_link_missing_count}", fg='yellow'))
-    if csv_export and all_courses_for_csv:
-        save_to_csv(term, subject_code, subject_name, all_courses_for_csv)
+                                       data_for_summary, orig_data_for_summary, course_details, section_label=None)
+            if soup_page.find(class_="lastPage"):
+                click.echo("Detected last page.")
+                break
+        if section_link_missing_count > 0:
+            click.echo(click.style(f"Total sections with missing links: {section_link_missing_count}", fg='yellow'))
+        if csv_file:
+            flush_rows()
+            csv_file.close()
+            if csv_rows:
+                os.replace(csv_file.name, csv_filename)
+                debug(f"Found {csv_rows_with_links} out of {csv_rows} courses with section links for CSV", fg='green')
+                click.echo(f"Courses exported to CSV file: {csv_filename}")
+                click.echo(click.style(f"CSV validation: {csv_rows_with_links} rows with section links", fg='green'))
+            else:
+                os.remove(csv_file.name)
+                click.echo("No courses to export to CSV file.")
+        finished = True
+    finally:
+        pages.close()
+        # Whatever stopped the scrape early, close the temporary CSV and
+        # remove it so no partial export is left next to the real ones.
+        if csv_file and not finished:
+            csv_file.close()
+            try:
+                os.remove(csv_file.name)
+            except OSError:
+                pass
 
 def bl():
     text = query.building_list()
@@ -538,8 +587,10 @@ def cgs(term, building, room):
             print("{}-{}".format(x['strt_time'], x['stop_time']), x['title'])
 
 @click.group()
-def ucla():
-    pass
+@click.option("-v", "--verbose", is_flag=True, help="Print per-course and per-section diagnostics")
+def ucla(verbose):
+    if verbose:
+        debug_output.enable()
 
 @ucla.group(help="Search for classes offered in a term")
 @click.argument("term")
@@ -0,0 +1,113 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import orjson
+
+
+def default_cache_dir():
+    """$XDG_CACHE_HOME/ucla-cli, which is ~/.cache/ucla-cli unless overridden."""
+    return os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "ucla-cli")
+
+
+CACHE_DIR = default_cache_dir()
+
+
+def load_json(name, max_age):
+    """Return the cached value for name, or None if missing or older than max_age seconds."""
+    path = os.path.join(CACHE_DIR, name)
+    try:
+        if time.time() - os.path.getmtime(path) > max_age:
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_json(name, value):
+    """Atomically write value to the cache, ignoring unwritable cache directories."""
+    path = os.path.join(CACHE_DIR, name)
+    tmp = path + ".tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(value, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+class KeyedCache:
+    """A SQLite table of JSON values keyed by string, stored in CACHE_DIR.
+
+    One connection is shared by every thread and guarded by a lock. Like the
+    JSON files above, an unusable database just behaves as an empty cache.
+    """
+
+    def __init__(self, name):
+        self.path = os.path.join(CACHE_DIR, name)
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries"
+                " (url TEXT PRIMARY KEY, fetched_at INTEGER, payload BLOB,"
+                " etag TEXT, last_modified TEXT)"
+            )
+            # Databases written before the validator columns existed.
+            for column in ("etag", "last_modified"):
+                try:
+                    conn.execute(f"ALTER TABLE entries ADD COLUMN {column} TEXT")
+                except sqlite3.OperationalError:
+                    pass
+            self._conn = conn
+        return self._conn
+
+    def get_entry(self, key):
+        """Return (fetched_at, value, etag, last_modified) for key whatever its age, or None."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT fetched_at, payload, etag, last_modified FROM entries WHERE url = ?",
+                    (key,),
+                ).fetchone()
+        except (OSError, sqlite3.Error):
+            return None
+        if row is None:
+            return None
+        try:
+            return row[0], orjson.loads(row[1]), row[2], row[3]
+        except orjson.JSONDecodeError:
+            return None
+
+    def set(self, key, value, etag=None, last_modified=None):
+        """Store value for key, with the HTTP validators it was fetched with."""
+        self._write(
+            "INSERT OR REPLACE INTO entries (url, fetched_at, payload, etag, last_modified)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (key, int(time.time()), orjson.dumps(value), etag, last_modified),
+        )
+
+    def touch(self, key):
+        """Mark the entry for key as fresh again, e.g. after a 304 Not Modified."""
+        self._write(
+            "UPDATE entries SET fetched_at = ? WHERE url = ?", (int(time.time()), key)
+        )
+
+    def _write(self, sql, params):
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(sql, params)
+        except (OSError, sqlite3.Error):
+            pass
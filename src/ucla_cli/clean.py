@@ -1,5 +1,18 @@
 import re 
 
+TIME_RE = re.compile(r"(\d+):?(\d*)([pa])m")
+ENROLLED_RE = re.compile(r"(\d+) of (\d+) Enrolled")
+CLASS_FULL_RE = re.compile(r"Class Full \((\d+)\)")
+OVER_ENROLLED_RE = re.compile(r"Class Full \((\d+)\), Over Enrolled By (\d+)")
+CAPACITY_RE = re.compile(r"\((\d+) capacity, (\d+) enrolled, (\d+) waitlisted\)")
+WAITLIST_TAKEN_RE = re.compile(r"(\d+) of (\d+) Taken")
+WAITLIST_FULL_RE = re.compile(r"Waitlist Full \((\d+)\)")
+WAITLISTED_RE = re.compile(r"(\d+) Waitlisted, Contact Instructor/Department")
+
+# Location names are matched as patterns against every section's location.
+# There can be more of them than re's internal cache holds, so keep our own.
+_location_patterns = {}
+
 def clean_time(time, mode):
     if mode == "plain":
         return "".join(time)
@@ -7,7 +20,7 @@ def clean_time(time, mode):
         return clean_time_hacker(time)
 
 def parse_time(t):
-    m = re.match("(\d+):?(\d*)([pa])m", t)
+    m = TIME_RE.match(t)
     if not m:
         raise ValueError
     h = int(m.group(1))
@@ -55,16 +68,16 @@ def clean_status(status):
         return 0, 0
     if status == ["Waitlist"]:
         return 0, 0
-    m = re.search(r"(\d+) of (\d+) Enrolled", status[1])
+    m = ENROLLED_RE.search(status[1])
     if m:
         return int(m.group(1)), int(m.group(2))
-    m = re.search(r"Class Full \((\d+)\)", status[1])
+    m = CLASS_FULL_RE.search(status[1])
     if m:
         return int(m.group(1)), int(m.group(1))
-    m = re.search(r"Class Full \((\d+)\), Over Enrolled By (\d+)", status[1])
+    m = OVER_ENROLLED_RE.search(status[1])
     if m:
         return int(m.group(1)) + int(m.group(2)), int(m.group(1))
-    m = re.search(r"\((\d+) capacity, (\d+) enrolled, (\d+) waitlisted\)", status[1])
+    m = CAPACITY_RE.search(status[1])
     if m:
         return int(m.group(2)), int(m.group(1))
     raise ValueError
@@ -73,14 +86,14 @@ def clean_status(status):
 def clean_waitlist(waitlist):
     if waitlist == "No Waitlist":
         return 0, 0
-    m = re.search(r"(\d+) of (\d+) Taken", waitlist)
+    m = WAITLIST_TAKEN_RE.search(waitlist)
     if m:
         return int(m.group(1)), int(m.group(2))
-    m = re.search(r"Waitlist Full \((\d+)\)", waitlist)
+    m = WAITLIST_FULL_RE.search(waitlist)
     if m:
         return int(m.group(1)), int(m.group(1))
 
-    m = re.search(r"(\d+) Waitlisted, Contact Instructor/Department", waitlist)
+    m = WAITLISTED_RE.search(waitlist)
     if m:
         return int(m.group(1)), "?"
     raise ValueError
@@ -109,10 +122,16 @@ def clean_instructor(instructor):
     #    return ''
     return instructor
 
+def location_pattern(name):
+    pattern = _location_patterns.get(name)
+    if pattern is None:
+        pattern = _location_patterns[name] = re.compile(name)
+    return pattern
+
 def clean_location(location, locations):
     #if location == "No Location":
     #    return ''
-    ms = {l: re.match(l, location) for l in locations}
+    ms = {l: location_pattern(l).match(location) for l in locations}
     matches = {l: m for l,m in ms.items() if m}
     if len(matches) != 1:
         return location
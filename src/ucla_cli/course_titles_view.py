@@ -1,6 +1,6 @@
 import json
 
-import requests
+from ucla_cli.session import SESSION
 
 
 def course_titles_view(term, subject, subject_name, page):
@@ -79,7 +79,7 @@ def course_titles_view(term, subject, subject_name, page):
     }
     #    url = 'https://sa.ucla.edu/ro/public/soc/Results/CourseTitlesView?search_by=subject&model=%7B%22term_cd%22%3A%2223F%22%2C%22ses_grp_cd%22%3A%22%25%22%2C%22class_no%22%3Anull%2C%22crs_catlg_no%22%3Anull%2C%22subj_area_cd%22%3A%22MATH+++%22%2C%22subj_area_name%22%3A%22Mathematics+(MATH)%22%2C%22class_prim_act_fl%22%3A%22y%22%7D&pageNumber={}&filterFlags=%7B%22enrollment_status%22%3A%22O%2CW%2CC%2CX%2CT%2CS%22%2C%22advanced%22%3A%22y%22%2C%22meet_days%22%3A%22M%2CT%2CW%2CR%2CF%22%2C%22start_time%22%3A%228%3A00+am%22%2C%22end_time%22%3A%227%3A00+pm%22%2C%22meet_locations%22%3Anull%2C%22meet_units%22%3Anull%2C%22instructor%22%3Anull%2C%22class_career%22%3Anull%2C%22impacted%22%3A%22N%22%2C%22enrollment_restrictions%22%3Anull%2C%22enforced_requisites%22%3Anull%2C%22individual_studies%22%3A%22n%22%2C%22summer_session%22%3Anull%7D&_=1692429337029'.format(page)
     url = "https://sa.ucla.edu/ro/public/soc/Results/CourseTitlesView"
-    response = requests.get(
+    response = SESSION.get(
         url,
         params,
         cookies=cookies,
@@ -0,0 +1,22 @@
+import os
+
+import click
+
+# Per-course and per-section diagnostics are only printed when
+# UCLA_CLI_DEBUG is set to anything but "", "0", "false" or "no", or
+# --verbose is passed, and go to stderr so they never mix with results.
+def enabled_by_env():
+    return os.getenv("UCLA_CLI_DEBUG", "").strip().lower() not in ("", "0", "false", "no")
+
+
+DEBUG = enabled_by_env()
+
+
+def debug(message, fg=None):
+    if DEBUG:
+        click.secho(message, fg=fg, err=True)
+
+
+def enable():
+    global DEBUG
+    DEBUG = True
@@ -1,7 +1,7 @@
 from bs4 import BeautifulSoup
 
 def building_list(text):
-    soup = BeautifulSoup(text, 'html.parser')
+    soup = BeautifulSoup(text, 'lxml')
     table = soup.find("table")
     trs = table.find_all("tr")
     models = []
@@ -1,7 +1,10 @@
 import re
-import json
+
+import orjson
+
+CALENDAR_RE = re.compile(r"createFullCalendar\(\$.parseJSON\(\'(\[.*\])\'\)\)")
 
 def calendar_data(text):
-    m = re.search(r"createFullCalendar\(\$.parseJSON\(\'(\[.*\])\'\)\)", text)
-    calendar_data = json.loads(m.group(1))
+    m = CALENDAR_RE.search(text)
+    calendar_data = orjson.loads(m.group(1))
     return calendar_data
@@ -1,50 +1,55 @@
 import json
-from urllib.parse import parse_qs
+import re
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
+from ucla_cli.session import SESSION
 
-def _decode_url(url):
-    url, params = url.split("?")
-    params = parse_qs(params)
-    params = {key: [json.loads(v) for v in value] for key, value in params.items()}
-    return params
+# Only the section rows, their columns and the error banners are read from a
+# course summary, so skip building the rest of the page. A pattern is used
+# rather than a list since the strainer may see the unsplit class attribute.
+SUMMARY_STRAINER = SoupStrainer(
+    class_=re.compile(
+        r"\b(primary-row|statusColumn|waitlistColumn|dayColumn|timeColumn"
+        r"|locationColumn|unitsColumn|instructorColumn|cls-section"
+        r"|expanded-error-message|error_section)\b"
+    )
+)
 
 
-def prep_params(params):
-    return {key: [json.dumps(v) for v in value] for key, value in params.items()}
+# Only the model changes between course summary requests, so the filter
+# flags are encoded once.
+FILTER_FLAGS = json.dumps(
+    {
+        "enrollment_status": None,
+        "advanced": None,
+        "meet_days": None,
+        "start_time": None,
+        "end_time": None,
+        "meet_locations": None,
+        "meet_units": None,
+        "instructor": None,
+        "class_career": None,
+        "impacted": None,
+        "enrollment_restrictions": None,
+        "enforced_requisites": None,
+        "individual_studies": None,
+        "summer_session": None,
+    }
+)
 
 
 def get_course_summary(model):
-    raw_params = {
-        "model": [model],
-        "FilterFlags": [
-            {
-                "enrollment_status": None,
-                "advanced": None,
-                "meet_days": None,
-                "start_time": None,
-                "end_time": None,
-                "meet_locations": None,
-                "meet_units": None,
-                "instructor": None,
-                "class_career": None,
-                "impacted": None,
-                "enrollment_restrictions": None,
-                "enforced_requisites": None,
-                "individual_studies": None,
-                "summer_session": None,
-            }
-        ],
-        "_": [1692258949331],
+    params = {
+        "model": [json.dumps(model)],
+        "FilterFlags": [FILTER_FLAGS],
+        "_": ["1692258949331"],
     }
-    params = prep_params(raw_params)
     url = "https://sa.ucla.edu/ro/public/soc/Results/GetCourseSummary"
-    resp = requests.get(url, params)
-    soup = BeautifulSoup(resp.text, "html.parser")
-    if not soup.text:
+    resp = SESSION.get(url, params)
+    if not resp.text.strip():
         raise Exception
+    soup = BeautifulSoup(resp.text, "lxml", parse_only=SUMMARY_STRAINER)
     error = soup.find(class_="expanded-error-message")
     if error:
         raise Exception(error.text.strip())
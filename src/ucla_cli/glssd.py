@@ -1,6 +1,6 @@
 import json
 
-import requests
+from ucla_cli.session import SESSION
 
 
 def get_level_separated_search_data(term, subject):
@@ -20,7 +20,7 @@ def get_level_separated_search_data(term, subject):
         ],
         "level": ["3"],
     }
-    resp = requests.get(url, params)
+    resp = SESSION.get(url, params)
     return resp.text
 
 
@@ -1,8 +1,8 @@
-import requests
+from ucla_cli.session import SESSION
 
 def building_list():
     url = "https://registrar.ucla.edu/faculty-staff/classrooms-and-scheduling/building-list"
-    resp = requests.get(url)
+    resp = SESSION.get(url)
     return resp.text
 
 if __name__ == "__main__":
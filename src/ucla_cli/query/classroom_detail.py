@@ -1,4 +1,4 @@
-import requests
+from ucla_cli.session import SESSION
 
 def classroom_detail(term, building_code, room_code):
     url = "https://sa.ucla.edu/ro/Public/SOC/Results/ClassroomDetail"
@@ -6,7 +6,7 @@ def classroom_detail(term, building_code, room_code):
         "term": term,
         "classroom": "{}|{}".format(building_code, room_code),
     }
-    resp = requests.get(url, params)
+    resp = SESSION.get(url, params)
     text = resp.text
     error_msg = "Classroom not in use this quarter or the building has had a name change."
     if error_msg in text:
@@ -1,4 +1,4 @@
-import requests
+from ucla_cli.session import SESSION
 
 
 def results(term=None, subject=None):
@@ -14,5 +14,5 @@ def results(term=None, subject=None):
         "undefined": ["Go"],
         "btnIsInIndex": ["btn_inIndex"],
     }
-    resp = requests.get(url, params)
+    resp = SESSION.get(url, params)
     return resp.text
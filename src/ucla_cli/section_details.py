@@ -1,31 +1,73 @@
 # ucla_cli/section_details.py
 import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from bs4.dammit import EncodingDetector
 import click
-import time
-import random
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ucla_cli import cache
+from ucla_cli.debug import debug
+from ucla_cli.session import SESSION
+
+SECTION_DATA_RE = re.compile('section_data')
+# Only div#section is needed, so nav, scripts and footer are never built.
+SECTION_STRAINER = SoupStrainer('div', id='section')
+# The page ships its markup inside this template, which BeautifulSoup would
+# otherwise keep as template strings. Matched on the raw bytes, before any
+# decoding.
+SOC_APP_TEMPLATE_RE = re.compile(
+    rb'<template[^>]*\bid=["\']ucla-sa-soc-app["\'][^>]*>(.*?)</template>',
+    re.DOTALL | re.IGNORECASE,
+)
+CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+# Returned by get_page_content when the server answers 304 Not Modified.
+NOT_MODIFIED = object()
+
+# Details extracted successfully, by URL, for every caller in this process.
+# Failures are left out so a later call tries the page again.
+_details_cache = {}
+# The same details persisted across runs; descriptions rarely change in a day.
+_details_store = cache.KeyedCache("sections.db")
+DETAILS_MAX_AGE = 24 * 60 * 60
 
 REQUEST_HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 }
 
-def get_page_content(url, retries=3, delay=2):
-    for attempt in range(retries):
-        try:
-            response = requests.get(url, headers=REQUEST_HEADERS, timeout=15)
-            response.raise_for_status()
-            return response.text
-        except requests.exceptions.RequestException as e:
-            click.echo(click.style(f"Attempt {attempt + 1} failed to fetch {url}: {e}", fg='red'))
-            if attempt < retries - 1:
-                time.sleep(delay * (attempt + 1))
-            else:
-                click.echo(click.style(f"All retries failed for {url}.", fg='red'))
-                return None
+def get_page_content(url, etag=None, last_modified=None):
+    """Return (body, charset, etag, last_modified), or NOT_MODIFIED if the
+    etag/last_modified validators show the page is unchanged."""
+    headers = dict(REQUEST_HEADERS)
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    # Transient failures are already retried with backoff by the session.
+    try:
+        response = SESSION.get(url, headers=headers, timeout=15)
+        if response.status_code == 304:
+            return NOT_MODIFIED
+        response.raise_for_status()
+        # Only a declared charset; requests' ISO-8859-1 default for text/html
+        # would override the page's <meta charset>.
+        charset = CHARSET_RE.search(response.headers.get('Content-Type', ''))
+        return (response.content, charset.group(1) if charset else None,
+                response.headers.get('ETag'), response.headers.get('Last-Modified'))
+    except requests.exceptions.RequestException as e:
+        click.echo(click.style(f"Failed to fetch {url}: {e}", fg='red'))
+        return None
+
+def title_paragraphs(scope_element):
+    """Map each detail title's text to its <p>, in a single walk of scope_element."""
+    titles = {}
+    for title_p in scope_element.find_all('p', class_='class_detail_title'):
+        titles.setdefault(title_p.get_text(strip=True), title_p)
+    return titles
 
-def get_data_for_title(scope_element, title_str_exact):
-    title_p = scope_element.find('p', class_='class_detail_title', string=lambda t: t and t.strip() == title_str_exact)
+def get_data_for_title(titles, title_str_exact):
+    title_p = titles.get(title_str_exact)
     
     if title_p:
         data_element = None
@@ -46,12 +88,21 @@ def get_data_for_title(scope_element, title_str_exact):
                         data_element = next_sibling
         
         if not data_element:
-            data_element = title_p.find_next_sibling('p', class_=lambda x: x and 'section_data' in x)
+            data_element = title_p.find_next_sibling('p', class_=SECTION_DATA_RE)
         
         if data_element:
             if data_element.name == 'ul':
                 list_items_texts = []
-                for li in data_element.find_all('li', recursive=False):
+                for li in data_element.children:
+                    if li.name != 'li':
+                        continue
+                    # Most notes are plain text; only walk the children when
+                    # there is a link whose href needs to be kept.
+                    if li.find('a', recursive=False) is None:
+                        full_li_text = li.get_text(' ', strip=True)
+                        if full_li_text:
+                            list_items_texts.append(full_li_text)
+                        continue
                     li_text_parts = []
                     for content_item in li.contents:
                         if isinstance(content_item, str):
@@ -59,10 +110,10 @@ def get_data_for_title(scope_element, title_str_exact):
                         elif isinstance(content_item, Tag) and content_item.name == 'a':
                             href = content_item.get('href', '')
                             link_text = content_item.get_text(strip=True)
-                            link_representation = link_text
                             if href:
-                                link_representation += f" [{href}]"
-                            li_text_parts.append(link_representation.strip())
+                                li_text_parts.append(f"{link_text} [{href}]".strip())
+                            else:
+                                li_text_parts.append(link_text)
                         elif isinstance(content_item, Tag): # Other tags within li
                             li_text_parts.append(content_item.get_text(strip=True))
                     
@@ -92,45 +143,72 @@ def extract_section_details_from_url(section_url):
         default_details["course_description"] = "N/A (No URL provided)"
         return default_details
 
-    click.echo(click.style(f"Fetching section details from: {section_url}", fg='magenta'))
-    time.sleep(random.uniform(0.5, 1.5)) 
+    cached = _details_cache.get(section_url)
+    if cached is not None:
+        return cached
 
-    html_content = get_page_content(section_url)
-    if not html_content:
+    # Details older than DETAILS_MAX_AGE are revalidated rather than refetched.
+    stored = _details_store.get_entry(section_url)
+    if stored is not None and time.time() - stored[0] <= DETAILS_MAX_AGE:
+        _details_cache[section_url] = stored[1]
+        return stored[1]
+    etag, last_modified = (stored[2], stored[3]) if stored is not None else (None, None)
+
+    debug(f"Fetching section details from: {section_url}", fg='magenta')
+
+    page = get_page_content(section_url, etag, last_modified)
+    if page is NOT_MODIFIED:
+        debug(f"Section details unchanged since last fetch: {section_url}", fg='blue')
+        _details_store.touch(section_url)
+        _details_cache[section_url] = stored[1]
+        return stored[1]
+    if not page or not page[0]:
         default_details["course_description"] = "N/A (Failed to fetch page content)"
         return default_details
+    html_content, encoding, etag, last_modified = page
+    if encoding is None:
+        # Read <meta charset> now: once the template body is moved to the
+        # front, the head is no longer where BeautifulSoup looks for it.
+        encoding = EncodingDetector.find_declared_encoding(html_content, is_html=True)
 
-    soup = BeautifulSoup(html_content, 'html.parser')
-    content_to_parse = soup 
-    
-    template_tag = soup.find('template', id='ucla-sa-soc-app')
-    if template_tag:
-        click.echo(click.style(f"Found <template id='ucla-sa-soc-app'>. Parsing its content.", fg='blue'))
-        template_html_string = template_tag.decode_contents()
-        if template_html_string:
-            content_to_parse = BeautifulSoup(template_html_string, 'html.parser')
-        else:
-            click.echo(click.style(f"<template id='ucla-sa-soc-app'> found but has empty content. Will search in main document.", fg='yellow'))
+    template_match = SOC_APP_TEMPLATE_RE.search(html_content)
+    if template_match:
+        debug(f"Found <template id='ucla-sa-soc-app'>. Parsing its content ahead of the page.", fg='blue')
+        # Unwrapped and moved to the front, the template body is parsed as
+        # ordinary markup and its div#section is found before any outside it.
+        html_content = (template_match.group(1)
+                        + html_content[:template_match.start()]
+                        + html_content[template_match.end():])
     else:
-        click.echo(click.style(f"No <template id='ucla-sa-soc-app'> found. Parsing main document.", fg='yellow'))
+        debug(f"No <template id='ucla-sa-soc-app'> found. Parsing main document.", fg='yellow')
 
-    section_div = content_to_parse.find('div', id='section')
-    
-    if not section_div and content_to_parse is not soup:
-        click.echo(click.style(f"div#section not found in <template> content. Trying in main document again...", fg='yellow'))
-        section_div = soup.find('div', id='section')
+    soup = BeautifulSoup(html_content, 'lxml', from_encoding=encoding, parse_only=SECTION_STRAINER)
+    section_div = soup.find('div', id='section')
     
     if not section_div:
         click.echo(click.style(f"Could not find 'div#section' on page: {section_url}", fg='red'))
         return default_details
 
     details = default_details.copy()
+    titles = title_paragraphs(section_div)
 
-    details["course_description"] = get_data_for_title(section_div, "Course Description")
-    details["class_description_detail"] = get_data_for_title(section_div, "Class Description")
-    details["general_education_ge"] = get_data_for_title(section_div, "General Education (GE)")
-    details["writing_ii_requirement"] = get_data_for_title(section_div, "Writing II")
-    details["diversity_info"] = get_data_for_title(section_div, "Diversity")
-    details["class_notes"] = get_data_for_title(section_div, "Class Notes")
+    details["course_description"] = get_data_for_title(titles, "Course Description")
+    details["class_description_detail"] = get_data_for_title(titles, "Class Description")
+    details["general_education_ge"] = get_data_for_title(titles, "General Education (GE)")
+    details["writing_ii_requirement"] = get_data_for_title(titles, "Writing II")
+    details["diversity_info"] = get_data_for_title(titles, "Diversity")
+    details["class_notes"] = get_data_for_title(titles, "Class Notes")
     
-    return details
\ No newline at end of file
+    _details_cache[section_url] = details
+    _details_store.set(section_url, details, etag, last_modified)
+    return details
+
+
+def fetch_many(urls, workers=8):
+    """Return {url: details} for urls, fetching the pages concurrently.
+
+    The pages are I/O bound, so plain threads on the shared session are
+    enough; its rate limiter keeps the combined request rate polite.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(urls, pool.map(extract_section_details_from_url, urls)))
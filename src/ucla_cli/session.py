@@ -0,0 +1,94 @@
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+
+class RateLimiter:
+    """Token bucket shared by every thread making requests to one host."""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens < 1:
+                time.sleep((1 - self.tokens) / self.rate)
+                self.last = time.monotonic()
+                self.tokens = 1
+            self.tokens -= 1
+
+
+class ThrottledSession(Session):
+    """Session that paces requests separately for each host it talks to."""
+
+    def __init__(self, rate, burst=1):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.limiters = {}
+        self.limiters_lock = threading.Lock()
+
+    def limiter(self, url):
+        host = urlsplit(url).netloc
+        with self.limiters_lock:
+            if host not in self.limiters:
+                self.limiters[host] = RateLimiter(self.rate, self.burst)
+            return self.limiters[host]
+
+    def request(self, method, url, *args, **kwargs):
+        self.limiter(url).acquire()
+        return super().request(method, url, *args, **kwargs)
+
+
+# Minimum number of seconds between two requests to the same host. Override
+# with UCLA_CLI_REQUEST_INTERVAL.
+DEFAULT_REQUEST_INTERVAL = 1.5
+
+
+def request_interval():
+    try:
+        interval = float(os.getenv("UCLA_CLI_REQUEST_INTERVAL", DEFAULT_REQUEST_INTERVAL))
+    except ValueError:
+        return DEFAULT_REQUEST_INTERVAL
+    return interval if interval > 0 else DEFAULT_REQUEST_INTERVAL
+
+
+# Nearly every request goes to sa.ucla.edu, so share one session to keep the
+# connection alive between calls and let urllib3 retry transient failures.
+# Politeness comes from the per-host rate limit rather than sleeping before
+# each request, and only failed responses are backed off.
+SESSION = ThrottledSession(rate=1 / request_interval())
+# Ask for compressed pages (brotli is left out since requests can only decode
+# it with an extra package) and identify the tool to the registrar. The
+# listing request in course_titles_view and the section detail requests
+# still send the browser User-Agent they were written with, since neither
+# endpoint is known to accept another one.
+SESSION.headers.update({
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": "ucla-cli (+https://github.com/daviddavini/ucla-cli)",
+})
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+        ),
+    ),
+)
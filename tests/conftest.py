@@ -0,0 +1,78 @@
+import io
+import json
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+from urllib3.response import HTTPResponse
+
+from ucla_cli import cache, section_details
+from ucla_cli.session import SESSION
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def read_fixture(name):
+    return (FIXTURES / name).read_bytes()
+
+
+def html_response(url, body=b"", status=200, headers=None):
+    """A requests.Response for body, as the session would return it.
+
+    The body sits on a real urllib3 response, so it can be streamed or
+    read through .content. headers are added to, or replace, a UTF-8
+    text/html Content-Type; status may be any code, including 304 and
+    errors that raise_for_status rejects.
+    """
+    response = requests.Response()
+    response.status_code = status
+    response.reason = HTTPStatus(status).phrase
+    response.url = url
+    response.headers = CaseInsensitiveDict({"Content-Type": "text/html; charset=utf-8"})
+    response.headers.update(headers or {})
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.raw = HTTPResponse(body=io.BytesIO(body), status=status, preload_content=False)
+    return response
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point every cache at an empty temporary CACHE_DIR and return it.
+
+    The section details store and the in-process details memo are replaced
+    too, since both are created at import time.
+    """
+    path = tmp_path / "cache"
+    monkeypatch.setattr(cache, "CACHE_DIR", str(path))
+    monkeypatch.setattr(section_details, "_details_store", cache.KeyedCache("sections.db"))
+    monkeypatch.setattr(section_details, "_details_cache", {})
+    return path
+
+
+@pytest.fixture
+def fake_site(monkeypatch):
+    """Answer the session's requests with the saved pages in fixtures/.
+
+    Returns the list of requested URLs.
+    """
+    requested = []
+
+    def request(method, url, params=None, **kwargs):
+        requested.append(url)
+        if url.endswith("/soc/Results"):
+            body = read_fixture("results.html")
+        elif url.endswith("/CourseTitlesView"):
+            body = read_fixture("course_titles_page.html") if params["pageNumber"] == [1] else b""
+        elif url.endswith("/GetCourseSummary"):
+            path = json.loads(params["model"][0])["Path"]
+            body = read_fixture(f"course_summary_{path}.html")
+        elif "GetLevelSeparatedSearchData" in url:
+            body = read_fixture("section_detail.html")
+        else:
+            raise AssertionError(f"unexpected request to {url}")
+        return html_response(url, body)
+
+    monkeypatch.setattr(SESSION, "request", request)
+    return requested
@@ -0,0 +1,55 @@
+import os
+import sqlite3
+
+import orjson
+import pytest
+
+from ucla_cli import cache
+
+
+def test_keyed_cache_round_trip(cache_dir):
+    store = cache.KeyedCache("sections.db")
+    assert store.get_entry("https://x/1") is None
+    store.set("https://x/1", {"a": 1}, '"v1"', "Mon, 01 Jan 2024 00:00:00 GMT")
+    fetched_at, value, etag, last_modified = store.get_entry("https://x/1")
+    assert value == {"a": 1}
+    assert etag == '"v1"'
+    assert last_modified == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+def test_touch_refreshes_fetched_at(cache_dir):
+    store = cache.KeyedCache("sections.db")
+    store.set("https://x/1", {"a": 1})
+    with sqlite3.connect(store.path) as conn:
+        conn.execute("UPDATE entries SET fetched_at = 0")
+    store.touch("https://x/1")
+    assert store.get_entry("https://x/1")[0] > 0
+
+
+def test_old_schema_gains_validator_columns(cache_dir):
+    cache_dir.mkdir()
+    path = cache_dir / "sections.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE entries (url TEXT PRIMARY KEY, fetched_at INTEGER, payload BLOB)")
+        conn.execute("INSERT INTO entries VALUES (?, ?, ?)", ("https://x/1", 123, orjson.dumps({"a": 1})))
+    store = cache.KeyedCache("sections.db")
+    assert store.get_entry("https://x/1") == (123, {"a": 1}, None, None)
+    store.set("https://x/2", {"b": 2}, '"v2"', None)
+    assert store.get_entry("https://x/2")[1:] == ({"b": 2}, '"v2"', None)
+
+
+def test_unusable_database_behaves_as_empty(cache_dir):
+    cache_dir.mkdir()
+    (cache_dir / "sections.db").write_bytes(b"not a database" * 100)
+    store = cache.KeyedCache("sections.db")
+    assert store.get_entry("https://x/1") is None
+    store.set("https://x/1", {"a": 1})
+
+
+@pytest.mark.parametrize("xdg, expected", [
+    ("/tmp/xdg", "/tmp/xdg/ucla-cli"),
+    ("", os.path.expanduser("~/.cache/ucla-cli")),
+])
+def test_default_cache_dir_follows_xdg_cache_home(monkeypatch, xdg, expected):
+    monkeypatch.setenv("XDG_CACHE_HOME", xdg)
+    assert cache.default_cache_dir() == expected
@@ -0,0 +1,25 @@
+import csv
+
+from click.testing import CliRunner
+
+from ucla_cli.__main__ import subject_map_for, ucla
+
+from .conftest import FIXTURES
+
+
+def run_classes(tmp_path, monkeypatch, *args):
+    subject_map_for.cache_clear()
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "24F").mkdir()
+    return CliRunner().invoke(ucla, ["classes", *args, "24F", "subject-area", "MATH", "--csv"])
+
+
+def test_csv_export(tmp_path, monkeypatch, cache_dir, fake_site):
+    result = run_classes(tmp_path, monkeypatch)
+    assert result.exit_code == 0, result.output
+    assert "CSV validation: 4 rows with section links" in result.output
+    with open(tmp_path / "24F" / "MATH.csv", newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    with open(FIXTURES / "MATH.csv", newline="", encoding="utf-8") as f:
+        assert rows == list(csv.reader(f))
+    assert not (tmp_path / "24F" / "MATH.csv.tmp").exists()
@@ -0,0 +1,22 @@
+import pytest
+
+from ucla_cli import debug
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("", False),
+    ("0", False),
+    ("false", False),
+    ("No", False),
+    ("1", True),
+    ("true", True),
+    ("yes", True),
+])
+def test_enabled_by_env(monkeypatch, value, expected):
+    monkeypatch.setenv("UCLA_CLI_DEBUG", value)
+    assert debug.enabled_by_env() is expected
+
+
+def test_unset_is_off(monkeypatch):
+    monkeypatch.delenv("UCLA_CLI_DEBUG", raising=False)
+    assert debug.enabled_by_env() is False
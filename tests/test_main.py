@@ -0,0 +1,56 @@
+from bs4 import BeautifulSoup
+
+from ucla_cli.__main__ import COURSE_LIST_STRAINER, extract_all_section_data, extract_section_links
+from ucla_cli.clean import clean_course_summary
+from ucla_cli.get_course_summary import get_course_summary
+
+from .conftest import read_fixture
+
+MATH_31A = {"Term": "24F", "SubjectAreaCode": "MATH", "Path": "MATH0031A"}
+
+
+def test_listing_page_cls_sections_match_html_parser():
+    text = read_fixture("course_titles_page.html").decode("utf-8")
+    reference = BeautifulSoup(text, "html.parser")
+    soup = BeautifulSoup(text, "lxml", parse_only=COURSE_LIST_STRAINER)
+    assert len(soup.find_all(class_="cls-section")) == len(reference.find_all(class_="cls-section")) == 2
+    assert extract_section_links(soup) == extract_section_links(reference)
+
+
+def test_course_summary_cls_sections_match_html_parser(fake_site):
+    reference = BeautifulSoup(read_fixture("course_summary_MATH0031A.html").decode("utf-8"), "html.parser")
+    soup = get_course_summary(MATH_31A)
+    assert len(soup.find_all(class_="cls-section")) == len(reference.find_all(class_="cls-section")) == 2
+    assert len(soup.select("div.primary-row")) == len(reference.select("div.primary-row")) == 2
+    assert extract_all_section_data(soup) == extract_all_section_data(reference)
+
+
+def test_status_and_time_skip_text_of_nested_tags(fake_site):
+    lec_2 = extract_all_section_data(get_course_summary(MATH_31A))[1]
+    assert lec_2["status"] == ["Closed by Dept ", "Class Full (180)"]
+    assert lec_2["time"] == ["11am", "-12:15pm"]
+    cleaned = clean_course_summary(lec_2, {"location": {}}, "hacker")
+    assert cleaned["status"] == "C"
+    assert (cleaned["num_enrolled"], cleaned["total_spots"]) == (180, 180)
+    assert cleaned["time"] == "...B........"
+
+
+def test_extract_all_section_data(fake_site):
+    sections = extract_all_section_data(get_course_summary(MATH_31A))
+    link = "https://sa.ucla.edu/ro/ClassSearch/Public/Search/GetLevelSeparatedSearchData?t=24F&id="
+    assert sections == [
+        {
+            "class_id": "262151200", "status": ["Open", "145 of 180 Enrolled", "(35 Left)"],
+            "waitlist": "No Waitlist", "day": "MWF", "time": ["9am", "-9:50am"],
+            # A row has a single locationColumn, so the second-column lookup
+            # finds nothing; this mirrors the original scraper.
+            "location": "N/A", "units": "4.0", "instructor": "Kim, A.",
+            "section_id": "Lec 1", "section_link": link + "262151200",
+        },
+        {
+            "class_id": "262151210", "status": ["Closed by Dept ", "Class Full (180)"],
+            "waitlist": "12 of 20 Taken", "day": "TR", "time": ["11am", "-12:15pm"],
+            "location": "N/A", "units": "4.0", "instructor": "Lee, B.",
+            "section_id": "Lec 2", "section_link": link + "262151210",
+        },
+    ]
@@ -0,0 +1,116 @@
+import sqlite3
+
+import pytest
+
+from ucla_cli import section_details
+
+from .conftest import html_response
+
+
+def detail_page(description, head="", extra=""):
+    return (
+        f'<html><head>{head}<title>t</title></head><body><nav>nav</nav>'
+        f'<template id="ucla-sa-soc-app"><div id="section">'
+        f'<p class="class_detail_title">Course Description</p>'
+        f'<p class="section_data">{description}</p>{extra}'
+        f'</div></template><footer>f</footer></body></html>'
+    )
+
+
+def serve(monkeypatch, *responses):
+    """Answer successive SESSION.get calls with responses, recording the headers sent."""
+    sent = []
+    queue = list(responses)
+
+    def get(url, headers=None, **kwargs):
+        sent.append(headers or {})
+        return queue.pop(0)
+
+    monkeypatch.setattr(section_details.SESSION, "get", get)
+    return sent
+
+
+@pytest.mark.parametrize("extra", ["", "<p>padding</p>" * 1000])
+def test_meta_charset_used_when_header_has_none(cache_dir, monkeypatch, extra):
+    # The padded page moves <meta> well past the start once the template
+    # body is put in front of it.
+    body = detail_page("Café — seminar", head='<meta charset="utf-8">', extra=extra).encode("utf-8")
+    serve(monkeypatch, html_response("https://x/1", body, headers={"Content-Type": "text/html"}))
+    details = section_details.extract_section_details_from_url("https://x/1")
+    assert details["course_description"] == "Café — seminar"
+
+
+def test_template_section_wins_over_outer_section(cache_dir, monkeypatch):
+    body = detail_page("From the template").replace(
+        "<nav>nav</nav>",
+        '<div id="section"><p class="class_detail_title">Course Description</p>'
+        '<p class="section_data">Outside the template</p></div>',
+    ).encode()
+    serve(monkeypatch, html_response("https://x/1", body))
+    details = section_details.extract_section_details_from_url("https://x/1")
+    assert details["course_description"] == "From the template"
+
+
+def test_header_charset_wins(cache_dir, monkeypatch):
+    body = detail_page("Café seminar").encode("windows-1252")
+    serve(monkeypatch, html_response(
+        "https://x/1", body, headers={"Content-Type": "text/html; charset=windows-1252"}))
+    details = section_details.extract_section_details_from_url("https://x/1")
+    assert details["course_description"] == "Café seminar"
+
+
+def test_fresh_details_skip_the_request(cache_dir, monkeypatch):
+    section_details._details_store.set("https://x/1", {"course_description": "stored"})
+    sent = serve(monkeypatch)
+    details = section_details.extract_section_details_from_url("https://x/1")
+    assert details == {"course_description": "stored"}
+    assert sent == []
+
+
+def test_stale_details_revalidated_with_304(cache_dir, monkeypatch):
+    body = detail_page("Lecture, three hours.").encode()
+    validators = {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    sent = serve(monkeypatch, html_response("https://x/1", body, headers=validators),
+                 html_response("https://x/1", status=304))
+
+    store = section_details._details_store
+    first = section_details.extract_section_details_from_url("https://x/1")
+    assert first["course_description"] == "Lecture, three hours."
+    assert store.get_entry("https://x/1")[2:] == ('"v1"', validators["Last-Modified"])
+
+    with sqlite3.connect(store.path) as conn:
+        conn.execute("UPDATE entries SET fetched_at = 0")
+    section_details._details_cache.clear()
+    monkeypatch.setattr(section_details, "BeautifulSoup", None)  # a 304 must not parse
+
+    second = section_details.extract_section_details_from_url("https://x/1")
+    assert second == first
+    assert sent[1]["If-None-Match"] == '"v1"'
+    assert sent[1]["If-Modified-Since"] == validators["Last-Modified"]
+    assert sent[1]["User-Agent"] == section_details.REQUEST_HEADERS["User-Agent"]
+    assert store.get_entry("https://x/1")[0] > 0
+
+
+def test_failed_fetch_is_not_cached(cache_dir, monkeypatch):
+    sent = serve(monkeypatch, html_response("https://x/1", status=500),
+                 html_response("https://x/1", detail_page("Second try").encode()))
+    first = section_details.extract_section_details_from_url("https://x/1")
+    assert first["course_description"] == "N/A (Failed to fetch page content)"
+    second = section_details.extract_section_details_from_url("https://x/1")
+    assert second["course_description"] == "Second try"
+    assert len(sent) == 2
+
+
+def test_extract_saved_detail_page(cache_dir, fake_site):
+    details = section_details.extract_section_details_from_url(
+        "https://sa.ucla.edu/ro/ClassSearch/Public/Search/GetLevelSeparatedSearchData?t=24F&id=1")
+    assert details == {
+        "course_description": "Lecture, three hours; discussion, one hour. "
+                              "Differential calculus and applications — café edition.",
+        "class_description_detail": "N/A (Empty)",
+        "general_education_ge": "Foundations of Scientific Inquiry Physical Science",
+        "writing_ii_requirement": "N/A",
+        "diversity_info": "N/A",
+        "class_notes": "See the department site [https://www.math.ucla.edu/ugrad] for placement. ; "
+                       "Enrollment is restricted to first-years.",
+    }
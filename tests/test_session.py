@@ -0,0 +1,39 @@
+import pytest
+
+from ucla_cli import session
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, 1.5),
+    ("3", 3.0),
+    ("0.25", 0.25),
+    ("0", 1.5),
+    ("-1", 1.5),
+    ("fast", 1.5),
+])
+def test_request_interval(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv("UCLA_CLI_REQUEST_INTERVAL", raising=False)
+    else:
+        monkeypatch.setenv("UCLA_CLI_REQUEST_INTERVAL", value)
+    assert session.request_interval() == expected
+
+
+def test_rate_limiter_spaces_requests(monkeypatch):
+    clock = [100.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(session.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(session.time, "sleep", sleep)
+    limiter = session.RateLimiter(rate=1 / 1.5)
+    for _ in range(3):
+        limiter.acquire()
+    assert sleeps == pytest.approx([1.5, 1.5])
+
+
+def test_session_does_not_burst():
+    assert session.SESSION.limiter("https://sa.ucla.edu/").burst == 1